@@ -1,5 +1,5 @@
 const ethers = require("ethers");
-const readline = require("readline");
+const { encode, decode } = require("@msgpack/msgpack");
 
 // Global context (persistent across commands)
 let provider;
@@ -15,13 +15,9 @@ let contract;
 // Store captured console output
 let capturedLogs = [];
 
-// Save original console methods (for IPC communication)
-const originalConsole = {
-  log: console.log.bind(console),
-  error: console.error.bind(console),
-  warn: console.warn.bind(console),
-  info: console.info.bind(console),
-};
+// IPC responses go over binary stdout frames (see writeResponse), so the
+// console can stay permanently redirected to the capture buffer without
+// risking corruption of the protocol stream.
 
 // Override console methods to capture output during user code execution
 const userConsole = {
@@ -107,6 +103,46 @@ const fromWei = (wei) => {
   return ethers.formatEther(wei);
 };
 
+// ============================================================================
+// Compiled-snippet cache
+// ============================================================================
+
+// Agents frequently resend identical probes (retry loops, repeated reads);
+// caching the compiled async wrapper lets V8 skip re-parsing the snippet.
+// Keyed by exact source text, evicted FIFO.
+const compiledSnippets = new Map();
+const MAX_CACHED_SNIPPETS = 256;
+
+/**
+ * Compile a user snippet into a reusable async function.
+ * Tries the expression-return wrapper first (captures values like
+ * "await contract.owner()"); on SyntaxError (e.g. multi-statement code)
+ * falls back to the plain-body wrapper. Runtime errors surface when the
+ * returned function is invoked, matching previous eval semantics.
+ * @param {string} code - JavaScript code to compile
+ * @returns {Function} - Async function executing the snippet
+ */
+function compileSnippet(code) {
+  let fn = compiledSnippets.get(code);
+  if (fn) return fn;
+
+  try {
+    fn = eval(`(async () => { return (${code}) })`);
+  } catch (e) {
+    if (e instanceof SyntaxError) {
+      fn = eval(`(async () => { ${code} })`);
+    } else {
+      throw e;
+    }
+  }
+
+  if (compiledSnippets.size >= MAX_CACHED_SNIPPETS) {
+    compiledSnippets.delete(compiledSnippets.keys().next().value);
+  }
+  compiledSnippets.set(code, fn);
+  return fn;
+}
+
 /**
  * Initialize the sandbox with blockchain configuration.
  * @param {Object} config - Configuration object with rpcUrl, playerPrivateKey, ethernautAddress, ethernautAbi
@@ -164,20 +200,8 @@ async function executeCode(code) {
 
     // Create execution promise
     const execPromise = (async () => {
-      let result;
-
-      // Strategy: Try with return() first (captures expression values like "await contract.owner()")
-      // If syntax error (due to ; or const/let), fall back to no-return (supports multi-statement)
-      try {
-        result = await eval(`(async () => { return (${code}) })()`);
-      } catch (e) {
-        // If syntax error (likely due to ; or const/let), try without return wrapper
-        if (e instanceof SyntaxError) {
-          result = await eval(`(async () => { ${code} })()`);
-        } else {
-          throw e; // Re-throw non-syntax errors (e.g., runtime errors)
-        }
-      }
+      // Compiled once per distinct snippet, then reused across turns
+      const result = await compileSnippet(code)();
 
       // Convert result to string, handling objects and BigInts properly
       if (result === null || result === undefined) {
@@ -196,7 +220,7 @@ async function executeCode(code) {
     const resultStr = await Promise.race([execPromise, timeoutPromise]);
 
     // Don't restore console - keep capturing version active for async callbacks
-    // IPC uses originalConsole directly to avoid interference
+    // IPC frames bypass console entirely to avoid interference
 
     // Truncate if too long
     if (resultStr.length > 10000) {
@@ -214,7 +238,7 @@ async function executeCode(code) {
     };
   } catch (error) {
     // Don't restore console - keep capturing version active for async callbacks
-    // IPC uses originalConsole directly to avoid interference
+    // IPC frames bypass console entirely to avoid interference
 
     return {
       success: false,
@@ -224,6 +248,22 @@ async function executeCode(code) {
   }
 }
 
+/**
+ * Reset level-scoped state without restarting the process.
+ * Keeps the warmed V8/ethers module tree alive across levels; with a
+ * config, re-initializes provider/wallet/ethernaut in place as well.
+ * @param {Object} [config] - Optional new blockchain configuration
+ * @returns {Promise<Object>} - {success: true} or {success: false, error: message}
+ */
+async function reset(config) {
+  if (config) {
+    return initialize(config);
+  }
+  contract = undefined;
+  capturedLogs = [];
+  return { success: true };
+}
+
 /**
  * Set the current contract instance.
  * @param {string} address - Contract address
@@ -257,16 +297,28 @@ function setContract(address, abi) {
   }
 }
 
-// Main IPC loop
-const rl = readline.createInterface({
-  input: process.stdin,
-  output: process.stdout,
-  terminal: false,
-});
+// ============================================================================
+// Main IPC loop: length-prefixed msgpack frames over stdio
+// Each frame is a 4-byte big-endian length followed by a msgpack payload.
+// ============================================================================
 
-rl.on("line", async (line) => {
+/**
+ * Write a response object to stdout as a length-prefixed msgpack frame.
+ * @param {Object} response - Response object to send
+ */
+function writeResponse(response) {
+  const payload = encode(response);
+  const header = Buffer.alloc(4);
+  header.writeUInt32BE(payload.length, 0);
+  process.stdout.write(Buffer.concat([header, Buffer.from(payload)]));
+}
+
+/**
+ * Dispatch a decoded command message and write its response.
+ * @param {Object} msg - Decoded command message
+ */
+async function handleMessage(msg) {
   try {
-    const msg = JSON.parse(line);
     let response;
 
     switch (msg.command) {
@@ -279,37 +331,50 @@ rl.on("line", async (line) => {
       case "set_contract":
         response = setContract(msg.address, msg.abi);
         break;
+      case "reset":
+        response = await reset(msg.config);
+        break;
       default:
         response = { success: false, error: "Unknown command" };
     }
 
-    // Use originalConsole for IPC to avoid interference with user console capture
-    originalConsole.log(JSON.stringify(response));
+    // Echo the request id so the Python side can match the response
+    response.id = msg.id;
+    writeResponse(response);
   } catch (error) {
-    originalConsole.log(
-      JSON.stringify({
-        success: false,
-        error: error.message,
-      }),
-    );
+    writeResponse({ id: msg.id, success: false, error: error.message });
+  }
+}
+
+let pendingInput = Buffer.alloc(0);
+
+process.stdin.on("data", (chunk) => {
+  pendingInput = Buffer.concat([pendingInput, chunk]);
+
+  // Drain every complete frame currently buffered
+  while (pendingInput.length >= 4) {
+    const frameLength = pendingInput.readUInt32BE(0);
+    if (pendingInput.length < 4 + frameLength) break;
+
+    const frame = pendingInput.subarray(4, 4 + frameLength);
+    pendingInput = pendingInput.subarray(4 + frameLength);
+
+    let msg;
+    try {
+      msg = decode(frame);
+    } catch (error) {
+      writeResponse({ success: false, error: `Bad frame: ${error.message}` });
+      continue;
+    }
+    handleMessage(msg);
   }
 });
 
 // Handle uncaught errors
 process.on("uncaughtException", (error) => {
-  originalConsole.log(
-    JSON.stringify({
-      success: false,
-      error: `Uncaught: ${error.message}`,
-    }),
-  );
+  writeResponse({ success: false, error: `Uncaught: ${error.message}` });
 });
 
 process.on("unhandledRejection", (error) => {
-  originalConsole.log(
-    JSON.stringify({
-      success: false,
-      error: `Unhandled rejection: ${error.message}`,
-    }),
-  );
+  writeResponse({ success: false, error: `Unhandled rejection: ${error.message}` });
 });
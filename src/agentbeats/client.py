@@ -23,6 +23,10 @@ from a2a.types import (
 
 DEFAULT_TIMEOUT = 300
 
+# Agent cards are static per endpoint; caching them saves a discovery
+# round trip on every message when a persistent client is reused
+_agent_card_cache: dict = {}
+
 
 def create_message(*, role: Role = Role.user, text: str, context_id: str | None = None) -> Message:
     """Create an A2A message.
@@ -67,7 +71,8 @@ async def send_message(
     base_url: str,
     context_id: str | None = None,
     streaming=False,
-    consumer: Consumer | None = None
+    consumer: Consumer | None = None,
+    httpx_client: httpx.AsyncClient | None = None,
 ):
     """Send a message to an A2A agent and get response.
 
@@ -77,6 +82,9 @@ async def send_message(
         context_id: Optional context ID for conversation continuity
         streaming: Whether to use streaming mode
         consumer: Optional event consumer for handling updates
+        httpx_client: Optional caller-managed client. Passing one keeps
+            connections alive across calls instead of paying a TCP (and
+            possibly TLS) handshake per message.
 
     Returns:
         Dict with keys:
@@ -84,45 +92,68 @@ async def send_message(
             - response: Agent's response text
             - status: Status if task-based (optional)
     """
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as httpx_client:
+    if httpx_client is None:
+        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as ephemeral_client:
+            return await _send_message_with_client(
+                ephemeral_client, message, base_url, context_id, streaming, consumer
+            )
+
+    return await _send_message_with_client(
+        httpx_client, message, base_url, context_id, streaming, consumer
+    )
+
+
+async def _send_message_with_client(
+    httpx_client: httpx.AsyncClient,
+    message: str,
+    base_url: str,
+    context_id: str | None,
+    streaming: bool,
+    consumer: Consumer | None,
+):
+    """Send a message using the given client. See send_message."""
+    agent_card = _agent_card_cache.get(base_url)
+    if agent_card is None:
         resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
         agent_card = await resolver.get_agent_card()
-        config = ClientConfig(
-            httpx_client=httpx_client,
-            streaming=streaming,
-        )
-        factory = ClientFactory(config)
-        client = factory.create(agent_card)
-        if consumer:
-            await client.add_event_consumer(consumer)
-
-        outbound_msg = create_message(text=message, context_id=context_id)
-        last_event = None
-        outputs = {
-            "response": "",
-            "context_id": None
-        }
-
-        # if streaming == False, only one event is generated
-        async for event in client.send_message(outbound_msg):
-            last_event = event
-
-        match last_event:
-            case Message() as msg:
-                outputs["context_id"] = msg.context_id
-                outputs["response"] += merge_parts(msg.parts)
+        _agent_card_cache[base_url] = agent_card
 
-            case (task, update):
-                outputs["context_id"] = task.context_id
-                outputs["status"] = task.status.state.value
-                msg = task.status.message
-                if msg:
-                    outputs["response"] += merge_parts(msg.parts)
-                if task.artifacts:
-                    for artifact in task.artifacts:
-                        outputs["response"] += merge_parts(artifact.parts)
+    config = ClientConfig(
+        httpx_client=httpx_client,
+        streaming=streaming,
+    )
+    factory = ClientFactory(config)
+    client = factory.create(agent_card)
+    if consumer:
+        await client.add_event_consumer(consumer)
+
+    outbound_msg = create_message(text=message, context_id=context_id)
+    last_event = None
+    outputs = {
+        "response": "",
+        "context_id": None
+    }
+
+    # if streaming == False, only one event is generated
+    async for event in client.send_message(outbound_msg):
+        last_event = event
+
+    match last_event:
+        case Message() as msg:
+            outputs["context_id"] = msg.context_id
+            outputs["response"] += merge_parts(msg.parts)
+
+        case (task, update):
+            outputs["context_id"] = task.context_id
+            outputs["status"] = task.status.state.value
+            msg = task.status.message
+            if msg:
+                outputs["response"] += merge_parts(msg.parts)
+            if task.artifacts:
+                for artifact in task.artifacts:
+                    outputs["response"] += merge_parts(artifact.parts)
 
-            case _:
-                pass
+        case _:
+            pass
 
-        return outputs
+    return outputs
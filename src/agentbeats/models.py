@@ -1,7 +1,7 @@
 """Core data models for AgentBeats framework."""
 
 from typing import Any
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, field_validator
 
 
 class EvalRequest(BaseModel):
@@ -11,9 +11,23 @@ class EvalRequest(BaseModel):
         participants: Dict mapping role names to agent endpoint URLs
         config: Optional configuration parameters for the evaluation
     """
-    participants: dict[str, HttpUrl]  # role -> endpoint mapping
+    participants: dict[str, str]  # role -> endpoint mapping
     config: dict[str, Any]
 
+    @field_validator("participants")
+    @classmethod
+    def _check_participant_urls(cls, participants: dict[str, str]) -> dict[str, str]:
+        """Cheap scheme check on endpoint URLs.
+
+        Endpoints are trusted intra-cluster addresses; a full RFC-3986
+        HttpUrl validation per URL is unnecessary overhead on the request
+        hot path.
+        """
+        for role, url in participants.items():
+            if not url.startswith(("http://", "https://")):
+                raise ValueError(f"Invalid endpoint URL for role '{role}': {url}")
+        return participants
+
 
 class EvalResult(BaseModel):
     """Result of an evaluation.
@@ -1,7 +1,10 @@
 """Tool management and agent communication for AgentBeats framework."""
 
 from typing import Any
-from agentbeats.client import send_message
+
+import httpx
+
+from agentbeats.client import DEFAULT_TIMEOUT, send_message
 
 
 class ToolProvider:
@@ -16,6 +19,13 @@ class ToolProvider:
         """Initialize tool provider with empty context and tool registry."""
         self._context_ids: dict[str, str | None] = {}
         self.tools: dict[str, dict[str, Any]] = {}
+        self._tools_list_cache: list[dict[str, Any]] | None = None
+        # Persistent client so consecutive turns with the same agent reuse
+        # one connection instead of reconnecting per message
+        self._client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        )
 
     async def talk_to_agent(self, message: str, url: str, new_conversation: bool = False) -> str:
         """Communicate with another agent by sending a message and receiving their response.
@@ -34,7 +44,8 @@ class ToolProvider:
         outputs = await send_message(
             message=message,
             base_url=url,
-            context_id=None if new_conversation else self._context_ids.get(url, None)
+            context_id=None if new_conversation else self._context_ids.get(url, None),
+            httpx_client=self._client,
         )
         if outputs.get("status", "completed") != "completed":
             raise RuntimeError(f"{url} responded with: {outputs}")
@@ -42,9 +53,17 @@ class ToolProvider:
         return outputs["response"]
 
     def reset(self):
-        """Reset conversation contexts."""
+        """Reset conversation contexts.
+
+        The underlying HTTP client is kept alive; only conversation state
+        is cleared.
+        """
         self._context_ids = {}
 
+    async def aclose(self):
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
     def register_tool(self, name: str, description: str, parameters: dict[str, Any]) -> None:
         """Register a tool with JSON Schema definition.
 
@@ -59,6 +78,7 @@ class ToolProvider:
             "parameters": parameters
         }
         self.tools[name] = tool_def
+        self._tools_list_cache = None
 
     def get_tool_definitions(self) -> list[dict[str, Any]]:
         """Get all registered tools in A2A format.
@@ -66,4 +86,6 @@ class ToolProvider:
         Returns:
             List of tool definitions as JSON Schema compatible dicts
         """
-        return list(self.tools.values())
+        if self._tools_list_cache is None:
+            self._tools_list_cache = list(self.tools.values())
+        return self._tools_list_cache
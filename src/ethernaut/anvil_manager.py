@@ -1,17 +1,76 @@
 """Anvil blockchain manager for local Ethereum environment with multi-level support."""
 
 import asyncio
+import functools
 import json
-import subprocess
+import socket
 import time
 from pathlib import Path
 
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
+
+# Receipt poll intervals in seconds; Anvil instamines, so the first or
+# second probe almost always succeeds. The tail settles at 0.5s so a
+# genuinely slow transaction costs ~2 RPC probes per second instead of 10
+_RECEIPT_BACKOFF = (0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5)
+
+try:
+    import orjson
+
+    def _load_json(path: Path) -> dict:
+        """Parse a JSON file with orjson (much faster on multi-MB Foundry artifacts)."""
+        return orjson.loads(path.read_bytes())
+
+except ImportError:
+
+    def _load_json(path: Path) -> dict:
+        """Parse a JSON file with stdlib json (orjson not installed)."""
+        return json.loads(path.read_bytes())
+
+
+class _RPCAdapter(HTTPAdapter):
+    """HTTPAdapter pinning low-latency socket options for local JSON-RPC.
+
+    Disables Nagle (TCP_NODELAY) and enables keep-alive on every pooled
+    socket, so tiny JSON-RPC payloads are sent immediately instead of
+    being coalesced, regardless of the urllib3 version's defaults.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_artifact(path: str) -> tuple[list, str]:
+    """Load a Foundry artifact's ABI and bytecode, caching parsed results.
+
+    Artifacts only change when 'forge build' reruns, so parsed results are
+    cached per process (keyed on the path string) to avoid re-reading and
+    re-parsing the same multi-MB JSON on every level deploy. Only the abi
+    and bytecode fields are retained; the bulky remainder of the artifact
+    (AST, source maps, metadata) is dropped right away so the parse tree
+    can be garbage collected.
+
+    Args:
+        path: Path to the artifact JSON file
+
+    Returns:
+        Tuple of (abi, bytecode)
+    """
+    artifact = _load_json(Path(path))
+    return artifact["abi"], artifact["bytecode"]["object"]
+
 
-# Import LevelConfig for type hints
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from ethernaut.levels.level_config import LevelConfig
 
 
@@ -20,15 +79,28 @@ class AnvilManager:
 
     def __init__(self):
         """Initialize AnvilManager."""
-        self.process: subprocess.Popen | None = None
+        self.process: asyncio.subprocess.Process | None = None
         self.web3: Web3 | None = None
+        self._session: requests.Session | None = None
         self.accounts: list[str] = []
         self.ethernaut_address: str | None = None
         self.ethernaut_abi: list | None = None
+        self.ethernaut = None  # persistent Ethernaut contract proxy
+        self._contracts_dir = (
+            Path(__file__).resolve().parent.parent.parent / "contracts" / "out"
+        )
+        # factory_contract name -> (deploy_calldata, factory_abi, instance_abi)
+        self._factory_cache: dict[str, tuple[str, list, list]] = {}
+        self._start_lock = asyncio.Lock()
+        self._start_info: dict | None = None
 
     async def start(self, port: int = 8545) -> dict[str, str]:
         """Start Anvil and deploy the main Ethernaut contract.
 
+        Safe to call concurrently: a lock makes re-entrant calls wait for
+        the first one and then return the same start info instead of
+        spawning duplicate Anvil processes.
+
         Args:
             port: Port to run Anvil on
 
@@ -39,13 +111,26 @@ class AnvilManager:
             TimeoutError: If Anvil doesn't start within timeout
             RuntimeError: If Anvil process fails to start
         """
+        async with self._start_lock:
+            if self._start_info is not None:
+                return self._start_info
+            return await self._start(port)
+
+    async def _start(self, port: int) -> dict[str, str]:
+        """Start the Anvil subprocess and deploy contracts (lock held)."""
         try:
-            # Start Anvil subprocess
-            self.process = subprocess.Popen(
-                ["anvil", "--port", str(port), "--host", "127.0.0.1"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            # Start Anvil subprocess without blocking the event loop.
+            # Anvil logs every RPC; nothing drains its pipes, so captured
+            # output would eventually fill the pipe buffer and stall Anvil.
+            # Discard it instead.
+            self.process = await asyncio.create_subprocess_exec(
+                "anvil",
+                "--port",
+                str(port),
+                "--host",
+                "127.0.0.1",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
 
             logger.info(f"Anvil process started with PID {self.process.pid}")
@@ -53,12 +138,18 @@ class AnvilManager:
             # Wait for Anvil to be ready
             await self._wait_for_ready(port, timeout=10)
 
-            # Connect Web3
+            # Connect Web3 through a keep-alive session so every RPC in the
+            # deploy sequence reuses pooled TCP sockets instead of
+            # reconnecting; the adapter also pins TCP_NODELAY (see above)
             rpc_url = f"http://127.0.0.1:{port}"
-            self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._session = requests.Session()
+            self._session.mount(
+                "http://", _RPCAdapter(pool_connections=1, pool_maxsize=16)
+            )
+            self.web3 = Web3(Web3.HTTPProvider(rpc_url, session=self._session))
 
-            # Get accounts
-            self.accounts = self.web3.eth.accounts
+            # Get accounts (sync RPC, keep it off the event loop)
+            self.accounts = await asyncio.to_thread(lambda: self.web3.eth.accounts)
             logger.info(
                 f"Anvil started on port {port} with {len(self.accounts)} accounts"
             )
@@ -66,12 +157,13 @@ class AnvilManager:
             # Deploy main Ethernaut contract
             await self._deploy_ethernaut()
 
-            return {
+            self._start_info = {
                 "rpc_url": rpc_url,
                 "accounts": self.accounts,
                 "ethernaut_address": self.ethernaut_address,
                 "ethernaut_abi": self.ethernaut_abi,
             }
+            return self._start_info
 
         except Exception as e:
             logger.error(f"Failed to start Anvil: {e}")
@@ -80,7 +172,11 @@ class AnvilManager:
             raise
 
     async def _wait_for_ready(self, port: int, timeout: int = 10) -> None:
-        """Wait for Anvil to be ready by polling RPC.
+        """Wait for Anvil to accept TCP connections on its RPC port.
+
+        Anvil only starts listening once its RPC server is up, so a bare
+        TCP connect is a sufficient readiness probe. It is also cheap enough
+        to poll every 20ms, unlike a full JSON-RPC round trip.
 
         Args:
             port: Port to check
@@ -89,25 +185,51 @@ class AnvilManager:
         Raises:
             TimeoutError: If Anvil doesn't respond within timeout
         """
-        start_time = time.time()
-        rpc_url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
-                w3 = Web3(Web3.HTTPProvider(rpc_url))
-                # Try to get block number to verify RPC is working
-                block_num = w3.eth.block_number
-                logger.debug(f"Anvil RPC responding, block {block_num}")
-                return
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                await asyncio.sleep(0.02)
+                continue
 
-            except Exception as e:
-                logger.debug(f"Waiting for Anvil... {e}")
-                await asyncio.sleep(0.5)
+            writer.close()
+            logger.debug(f"Anvil listening on port {port}")
+            return
 
         raise TimeoutError(
             f"Anvil did not respond on port {port} within {timeout} seconds"
         )
 
+    async def wait_receipt(self, tx_hash, timeout: float = 30.0) -> dict:
+        """Wait for a transaction receipt without blocking the event loop.
+
+        web3's wait_for_transaction_receipt polls on a fixed 0.1s interval,
+        which pads every Anvil instamined transaction with sleep latency.
+        Polling with short initial delays returns the receipt almost
+        immediately.
+
+        Args:
+            tx_hash: Transaction hash to wait for
+            timeout: Overall timeout in seconds
+
+        Raises:
+            TimeoutError: If no receipt appears within timeout
+        """
+        delays = iter(_RECEIPT_BACKOFF)
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            try:
+                return await asyncio.to_thread(
+                    self.web3.eth.get_transaction_receipt, tx_hash
+                )
+            except TransactionNotFound:
+                await asyncio.sleep(next(delays, _RECEIPT_BACKOFF[-1]))
+
+        raise TimeoutError(f"No receipt for {tx_hash.hex()} within {timeout}s")
+
     async def _deploy_ethernaut(self) -> None:
         """Deploy the main Ethernaut contract (called once during start).
 
@@ -118,11 +240,8 @@ class AnvilManager:
         if not self.web3:
             raise RuntimeError("Web3 not connected")
 
-        # Define contracts directory relative to arena root
-        contracts_dir = Path(__file__).parent.parent.parent / "contracts" / "out"
-
         # Load Ethernaut artifact
-        ethernaut_artifact_path = contracts_dir / "Ethernaut.sol" / "Ethernaut.json"
+        ethernaut_artifact_path = self._contracts_dir / "Ethernaut.sol" / "Ethernaut.json"
         logger.debug(f"Loading Ethernaut artifact from {ethernaut_artifact_path}")
 
         if not ethernaut_artifact_path.exists():
@@ -130,84 +249,82 @@ class AnvilManager:
                 f"Ethernaut artifact not found at {ethernaut_artifact_path}"
             )
 
-        with open(ethernaut_artifact_path) as f:
-            ethernaut_artifact = json.load(f)
+        self.ethernaut_abi, ethernaut_bytecode = await asyncio.to_thread(
+            _load_artifact, str(ethernaut_artifact_path)
+        )
+
+        mock_stats_artifact_path = self._contracts_dir / "MockStatistics.sol" / "MockStatistics.json"
+        logger.debug(f"Loading MockStatistics artifact from {mock_stats_artifact_path}")
 
-        self.ethernaut_abi = ethernaut_artifact["abi"]
-        ethernaut_bytecode = ethernaut_artifact["bytecode"]["object"]
+        stats_abi, stats_bytecode = await asyncio.to_thread(
+            _load_artifact, str(mock_stats_artifact_path)
+        )
 
-        # Deploy Ethernaut
         account = self.accounts[0]
-        logger.info(f"Deploying Ethernaut contract from {account}")
+        logger.info(f"Deploying Ethernaut and MockStatistics contracts from {account}")
 
         Ethernaut = self.web3.eth.contract(
             abi=self.ethernaut_abi, bytecode=ethernaut_bytecode
         )
+        MockStats = self.web3.eth.contract(abi=stats_abi, bytecode=stats_bytecode)
 
-        tx_hash = Ethernaut.constructor().transact({"from": account})
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        self.ethernaut_address = receipt["contractAddress"]
-
-        logger.info(f"Ethernaut deployed at {self.ethernaut_address}")
-
-        # Deploy MockStatistics
-        mock_stats_artifact_path = contracts_dir / "MockStatistics.sol" / "MockStatistics.json"
-        logger.debug(f"Loading MockStatistics artifact from {mock_stats_artifact_path}")
-
-        with open(mock_stats_artifact_path) as f:
-            stats_artifact = json.load(f)
+        # Anvil auto-mines per transaction and the two constructor deploys
+        # are independent: submit both, then await their receipts concurrently
+        ethernaut_tx = await asyncio.to_thread(
+            Ethernaut.constructor().transact, {"from": account}
+        )
+        stats_tx = await asyncio.to_thread(
+            MockStats.constructor().transact, {"from": account}
+        )
 
-        stats_abi = stats_artifact["abi"]
-        stats_bytecode = stats_artifact["bytecode"]["object"]
+        ethernaut_receipt, stats_receipt = await asyncio.gather(
+            self.wait_receipt(ethernaut_tx),
+            self.wait_receipt(stats_tx),
+        )
 
-        logger.info("Deploying MockStatistics contract")
-        MockStats = self.web3.eth.contract(abi=stats_abi, bytecode=stats_bytecode)
-        tx_hash = MockStats.constructor().transact({"from": account})
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        stats_address = receipt["contractAddress"]
+        self.ethernaut_address = ethernaut_receipt["contractAddress"]
+        stats_address = stats_receipt["contractAddress"]
+        logger.info(f"Ethernaut deployed at {self.ethernaut_address}")
         logger.info(f"MockStatistics deployed at {stats_address}")
 
-        # Set statistics contract in Ethernaut
-        logger.info("Setting statistics contract in Ethernaut")
-        ethernaut_contract = self.web3.eth.contract(
+        # Build the Ethernaut proxy once; walking the ABI into contract
+        # function descriptors is expensive, so reuse it for all later calls
+        self.ethernaut = self.web3.eth.contract(
             address=self.ethernaut_address, abi=self.ethernaut_abi
         )
-        tx_hash = ethernaut_contract.functions.setStatistics(stats_address).transact(
-            {"from": account}
+
+        # Set statistics contract in Ethernaut
+        logger.info("Setting statistics contract in Ethernaut")
+        tx_hash = await asyncio.to_thread(
+            self.ethernaut.functions.setStatistics(stats_address).transact,
+            {"from": account},
         )
-        self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        await self.wait_receipt(tx_hash)
         logger.info("Statistics contract set successfully")
 
-    async def deploy_level_factory(self, level_config: LevelConfig) -> dict:
-        """Deploy a specific level's factory contract and register it with Ethernaut.
+    async def _ensure_factory_cached(
+        self, level_config: LevelConfig
+    ) -> tuple[str, list, list]:
+        """Load and cache a level's factory artifacts and deploy calldata.
 
         Args:
-            level_config: Configuration for the level to deploy
+            level_config: Configuration for the level
 
         Returns:
-            Dictionary with factory_address, factory_abi, and instance_abi
+            Tuple of (deploy_calldata, factory_abi, instance_abi)
 
         Raises:
-            RuntimeError: If Web3 not connected or Ethernaut not deployed
             FileNotFoundError: If contract artifacts not found
-            Exception: If deployment fails
         """
-        if not self.web3:
-            raise RuntimeError("Web3 not connected. Call start() first.")
-        if not self.ethernaut_address:
-            raise RuntimeError("Ethernaut not deployed. Call start() first.")
+        cached = self._factory_cache.get(level_config.factory_contract)
 
-        contracts_dir = Path(__file__).parent.parent.parent / "contracts" / "out"
-
-        try:
-            # Load factory artifact
+        if cached is None:
+            factory_name = level_config.factory_contract
             factory_artifact_path = (
-                contracts_dir
-                / f"{level_config.factory_contract}.sol"
-                / f"{level_config.factory_contract}.json"
+                self._contracts_dir / f"{factory_name}.sol" / f"{factory_name}.json"
             )
             logger.debug(
-                f"Loading {level_config.factory_contract} artifact from {factory_artifact_path}"
+                f"Loading {factory_name} artifact from {factory_artifact_path}"
             )
 
             if not factory_artifact_path.exists():
@@ -216,11 +333,70 @@ class AnvilManager:
                     f"Run 'cd contracts && forge build' to compile."
                 )
 
-            with open(factory_artifact_path) as f:
-                factory_artifact = json.load(f)
+            instance_name = level_config.instance_contract
+            instance_artifact_path = (
+                self._contracts_dir / f"{instance_name}.sol" / f"{instance_name}.json"
+            )
+
+            if not instance_artifact_path.exists():
+                raise FileNotFoundError(
+                    f"Instance artifact not found at {instance_artifact_path}"
+                )
+
+            # The two artifact loads are independent, parse concurrently
+            (factory_abi, factory_bytecode), (instance_abi, _) = await asyncio.gather(
+                asyncio.to_thread(_load_artifact, str(factory_artifact_path)),
+                asyncio.to_thread(_load_artifact, str(instance_artifact_path)),
+            )
+
+            # Factory constructors take no args, so the deploy calldata is
+            # invariant: encode it once and reuse on every redeploy
+            Factory = self.web3.eth.contract(
+                abi=factory_abi, bytecode=factory_bytecode
+            )
+            deploy_calldata = Factory.constructor()._encode_transaction_data()
+
+            cached = (deploy_calldata, factory_abi, instance_abi)
+            self._factory_cache[level_config.factory_contract] = cached
+
+        return cached
+
+    async def preload_level_artifacts(self, level_configs: list[LevelConfig]) -> None:
+        """Warm the factory artifact cache for the given levels.
+
+        Artifact parsing and calldata encoding are static per level, so
+        doing them once at setup keeps them off the per-level deploy path.
+
+        Args:
+            level_configs: Levels whose artifacts should be preloaded
+        """
+        await asyncio.gather(
+            *(self._ensure_factory_cached(cfg) for cfg in level_configs)
+        )
+
+    async def deploy_level_factory(self, level_config: LevelConfig) -> dict:
+        """Deploy a specific level's factory contract and register it with Ethernaut.
+
+        Args:
+            level_config: Configuration for the level to deploy
+
+        Returns:
+            Dictionary with factory_address, factory_abi, and instance_abi
 
-            factory_abi = factory_artifact["abi"]
-            factory_bytecode = factory_artifact["bytecode"]["object"]
+        Raises:
+            RuntimeError: If Web3 not connected or Ethernaut not deployed
+            FileNotFoundError: If contract artifacts not found
+            Exception: If deployment fails
+        """
+        if not self.web3:
+            raise RuntimeError("Web3 not connected. Call start() first.")
+        if not self.ethernaut_address:
+            raise RuntimeError("Ethernaut not deployed. Call start() first.")
+
+        try:
+            deploy_calldata, factory_abi, instance_abi = (
+                await self._ensure_factory_cached(level_config)
+            )
 
             # Deploy factory
             account = self.accounts[0]
@@ -228,10 +404,11 @@ class AnvilManager:
                 f"Deploying {level_config.factory_contract} for Level {level_config.level_id}"
             )
 
-            Factory = self.web3.eth.contract(abi=factory_abi, bytecode=factory_bytecode)
-
-            tx_hash = Factory.constructor().transact({"from": account})
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_hash = await asyncio.to_thread(
+                self.web3.eth.send_transaction,
+                {"from": account, "data": deploy_calldata},
+            )
+            receipt = await self.wait_receipt(tx_hash)
             factory_address = receipt["contractAddress"]
 
             logger.info(f"{level_config.factory_contract} deployed at {factory_address}")
@@ -239,34 +416,14 @@ class AnvilManager:
             # Register level with Ethernaut
             logger.info(f"Registering Level {level_config.level_id} with Ethernaut")
 
-            ethernaut = self.web3.eth.contract(
-                address=self.ethernaut_address, abi=self.ethernaut_abi
-            )
-
-            tx_hash = ethernaut.functions.registerLevel(factory_address).transact(
-                {"from": account}
+            tx_hash = await asyncio.to_thread(
+                self.ethernaut.functions.registerLevel(factory_address).transact,
+                {"from": account},
             )
-            self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            await self.wait_receipt(tx_hash)
 
             logger.info(f"Level {level_config.level_id} registered with Ethernaut")
 
-            # Load instance contract ABI
-            instance_artifact_path = (
-                contracts_dir
-                / f"{level_config.instance_contract}.sol"
-                / f"{level_config.instance_contract}.json"
-            )
-
-            if not instance_artifact_path.exists():
-                raise FileNotFoundError(
-                    f"Instance artifact not found at {instance_artifact_path}"
-                )
-
-            with open(instance_artifact_path) as f:
-                instance_artifact = json.load(f)
-
-            instance_abi = instance_artifact["abi"]
-
             return {
                 "factory_address": factory_address,
                 "factory_abi": factory_abi,
@@ -299,20 +456,25 @@ class AnvilManager:
 
             # Wait for process to exit
             try:
-                self.process.wait(timeout=5)
+                await asyncio.wait_for(self.process.wait(), timeout=5)
                 logger.info("Anvil process terminated gracefully")
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 logger.warning("Anvil did not terminate, killing forcefully")
                 self.process.kill()
-                self.process.wait(timeout=2)
+                await asyncio.wait_for(self.process.wait(), timeout=2)
                 logger.info("Anvil process killed")
 
         except Exception as e:
             logger.error(f"Error stopping Anvil: {e}")
 
         finally:
+            if self._session:
+                self._session.close()
             self.process = None
             self.web3 = None
+            self._session = None
             self.accounts = []
             self.ethernaut_address = None
             self.ethernaut_abi = None
+            self.ethernaut = None
+            self._start_info = None
@@ -1,9 +1,10 @@
 """Python wrapper for JavaScript sandbox subprocess."""
 
 import asyncio
-import subprocess
-import json
+import struct
 from pathlib import Path
+
+import msgpack
 from loguru import logger
 
 
@@ -12,8 +13,15 @@ class JSSandbox:
 
     def __init__(self):
         """Initialize JSSandbox."""
-        self.process: subprocess.Popen | None = None
+        self.process: asyncio.subprocess.Process | None = None
         self.sandbox_dir = Path(__file__).parent.parent.parent / "js_sandbox"
+        # Request/response multiplexing: commands carry an id the sandbox
+        # echoes back, and a single reader task resolves the matching
+        # future, so concurrent send_command calls do not serialize on
+        # one readline
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._reader_task: asyncio.Task | None = None
 
     async def start(self, rpc_url: str, contracts: dict, player_key: str) -> None:
         """Start the Node.js sandbox process and initialize it.
@@ -27,19 +35,23 @@ class JSSandbox:
             RuntimeError: If sandbox fails to start
         """
         try:
-            # Start Node.js subprocess
-            self.process = subprocess.Popen(
-                ["node", "sandbox.js"],
+            # Start Node.js subprocess with native asyncio pipes; reads and
+            # writes then stay on the event loop instead of hopping through
+            # an executor thread per command
+            self.process = await asyncio.create_subprocess_exec(
+                "node",
+                "sandbox.js",
                 cwd=self.sandbox_dir,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
 
             logger.info(f"JS Sandbox process started with PID {self.process.pid}")
 
+            # The reader must be running before the first command is sent
+            self._reader_task = asyncio.create_task(self._read_responses())
+
             # Send init command
             init_response = await self.send_command(
                 {
@@ -86,11 +98,17 @@ class JSSandbox:
         if not self.process or not self.process.stdin or not self.process.stdout:
             raise RuntimeError("Sandbox process not running")
 
+        self._next_id += 1
+        req_id = self._next_id
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+
         try:
-            # Write command to stdin
-            command_json = json.dumps(command) + "\n"
-            self.process.stdin.write(command_json)
-            self.process.stdin.flush()
+            # Write command to stdin as a length-prefixed msgpack frame;
+            # the reader task resolves the future when the id echoes back
+            payload = msgpack.packb({**command, "id": req_id})
+            self.process.stdin.write(struct.pack(">I", len(payload)) + payload)
+            await self.process.stdin.drain()
 
             # Log JavaScript code for exec commands
             if command.get('command') == 'exec':
@@ -98,20 +116,8 @@ class JSSandbox:
                 logger.info(f"Executing JS: {code}")
             logger.debug(f"Sent command: {command.get('command')}")
 
-            # Read response from stdout with timeout
-            async def read_line():
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, self.process.stdout.readline)
-
-            response_line = await asyncio.wait_for(read_line(), timeout=timeout)
-
-            if not response_line:
-                raise RuntimeError("Sandbox closed unexpectedly")
-
-            # Log raw response before parsing (helps debug parsing errors)
-            logger.debug(f"Raw sandbox response: {response_line.strip()[:300]}")
+            response = await asyncio.wait_for(future, timeout=timeout)
 
-            response = json.loads(response_line)
             # Enhanced logging with result preview
             result_preview = str(response.get('result', ''))[:100]
             logger.debug(f"Received response: success={response.get('success')}, result={result_preview}")
@@ -121,17 +127,49 @@ class JSSandbox:
         except asyncio.TimeoutError:
             logger.error(f"Sandbox command timed out after {timeout}s")
             return {"success": False, "error": f"Timeout after {timeout}s"}
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse sandbox response: {e}")
-            # Log what we tried to parse to help debug
-            try:
-                logger.error(f"Raw response that failed to parse: {response_line[:200]}")
-            except:
-                pass
-            return {"success": False, "error": f"Invalid response: {e}"}
         except Exception as e:
             logger.error(f"Error sending command to sandbox: {e}")
             return {"success": False, "error": str(e)}
+        finally:
+            self._pending.pop(req_id, None)
+
+    async def _read_responses(self) -> None:
+        """Read response frames forever and resolve the matching futures.
+
+        Runs as a background task for the life of the sandbox process.
+        Responses without a known id (e.g. uncaught-exception reports from
+        the Node side) are logged and dropped.
+        """
+        try:
+            while True:
+                header = await self.process.stdout.readexactly(4)
+                (length,) = struct.unpack(">I", header)
+                frame = await self.process.stdout.readexactly(length)
+
+                try:
+                    response = msgpack.unpackb(frame, raw=False)
+                except ValueError as e:
+                    logger.error(f"Failed to parse sandbox response: {e}")
+                    continue
+
+                future = self._pending.pop(response.pop("id", None), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+                else:
+                    logger.warning(f"Unsolicited sandbox message: {response}")
+        except (asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            logger.error(f"Sandbox reader failed: {e}")
+        finally:
+            self._fail_pending(RuntimeError("Sandbox closed unexpectedly"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail all in-flight requests with the given error."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
 
     async def exec_code(self, code: str) -> dict:
         """Execute JavaScript code in the sandbox.
@@ -144,6 +182,24 @@ class JSSandbox:
         """
         return await self.send_command({"command": "exec", "code": code})
 
+    async def reset(self, config: dict | None = None) -> dict:
+        """Reset level-scoped sandbox state without restarting Node.js.
+
+        Restarting pays the V8/ethers cold start again; a reset keeps the
+        warm process and just clears the current contract (or re-inits
+        provider state when a new config is passed).
+
+        Args:
+            config: Optional new blockchain configuration (same shape as start)
+
+        Returns:
+            Response dictionary with success status
+        """
+        command: dict = {"command": "reset"}
+        if config is not None:
+            command["config"] = config
+        return await self.send_command(command)
+
     async def set_contract(self, address: str, abi: list) -> dict:
         """Set the current contract instance in the sandbox.
 
@@ -171,6 +227,10 @@ class JSSandbox:
         try:
             logger.info(f"Stopping JS Sandbox process (PID {self.process.pid})")
 
+            if self._reader_task:
+                self._reader_task.cancel()
+                self._reader_task = None
+
             # Close stdin to signal shutdown
             if self.process.stdin:
                 self.process.stdin.close()
@@ -180,12 +240,12 @@ class JSSandbox:
 
             # Wait for process to exit
             try:
-                self.process.wait(timeout=5)
+                await asyncio.wait_for(self.process.wait(), timeout=5)
                 logger.info("JS Sandbox process terminated gracefully")
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 logger.warning("JS Sandbox did not terminate, killing forcefully")
                 self.process.kill()
-                self.process.wait(timeout=2)
+                await asyncio.wait_for(self.process.wait(), timeout=2)
                 logger.info("JS Sandbox process killed")
 
         except Exception as e:
@@ -0,0 +1,463 @@
+"""Static data table for all Ethernaut level configurations.
+
+One module replaces the former per-level modules: a single import builds
+every config (cheap now that prompts are assembled lazily), instead of 41
+module imports each paying bytecode load and frame setup.
+"""
+
+from .level_config import LevelConfig
+
+# Ordered by level_id; the registry indexes this tuple directly
+LEVELS: tuple[LevelConfig, ...] = (
+    LevelConfig(
+    level_id=0,
+    name="Hello Ethernaut",
+    instance_contract="Instance",
+    factory_contract="InstanceFactory",
+    difficulty=0,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("info", "info1", "info2", "info42", "method7123949", "password", "authenticate")
+),
+    LevelConfig(
+    level_id=1,
+    name="Fallback",
+    instance_contract="Fallback",
+    factory_contract="FallbackFactory",
+    difficulty=1,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("contribute", "getContribution", "owner", "withdraw")
+),
+    LevelConfig(
+    level_id=2,
+    name="Fallout",
+    instance_contract="Fallout",
+    factory_contract="FalloutFactory",
+    difficulty=2,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("owner", "Fal1out")  # Note the typo is intentional
+),
+    LevelConfig(
+    level_id=3,
+    name="Coin Flip",
+    instance_contract="CoinFlip",
+    factory_contract="CoinFlipFactory",
+    difficulty=3,
+    max_turns=40,  # More turns needed for multiple flips
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("flip", "consecutiveWins")
+),
+    LevelConfig(
+    level_id=4,
+    name="Telephone",
+    instance_contract="Telephone",
+    factory_contract="TelephoneFactory",
+    difficulty=1,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("owner", "changeOwner")
+),
+    LevelConfig(
+    level_id=5,
+    name="Token",
+    instance_contract="Token",
+    factory_contract="TokenFactory",
+    difficulty=3,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("balanceOf", "transfer", "totalSupply")
+),
+    LevelConfig(
+    level_id=6,
+    name="Delegation",
+    instance_contract="Delegation",
+    factory_contract="DelegationFactory",
+    difficulty=4,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("owner", "pwn")
+),
+    LevelConfig(
+    level_id=7,
+    name="Force",
+    instance_contract="Force",
+    factory_contract="ForceFactory",
+    difficulty=5,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=()  # Contract has no public methods
+),
+    LevelConfig(
+    level_id=8,
+    name="Vault",
+    instance_contract="Vault",
+    factory_contract="VaultFactory",
+    difficulty=3,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("locked", "unlock")
+),
+    LevelConfig(
+    level_id=9,
+    name="King",
+    instance_contract="King",
+    factory_contract="KingFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.001,
+    extra_tools=(),
+    expected_methods=("_king", "prize")
+),
+    LevelConfig(
+    level_id=10,
+    name="Re-entrancy",
+    instance_contract="Reentrance",
+    factory_contract="ReentranceFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.001,
+    extra_tools=(),
+    expected_methods=("donate", "balanceOf", "withdraw")
+),
+    LevelConfig(
+    level_id=11,
+    name="Elevator",
+    instance_contract="Elevator",
+    factory_contract="ElevatorFactory",
+    difficulty=4,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("top", "floor", "goTo")
+),
+    LevelConfig(
+    level_id=12,
+    name="Privacy",
+    instance_contract="Privacy",
+    factory_contract="PrivacyFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("locked", "unlock")
+),
+    LevelConfig(
+    level_id=13,
+    name="Gatekeeper One",
+    instance_contract="GatekeeperOne",
+    factory_contract="GatekeeperOneFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("entrant", "enter")
+),
+    LevelConfig(
+    level_id=14,
+    name="Gatekeeper Two",
+    instance_contract="GatekeeperTwo",
+    factory_contract="GatekeeperTwoFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("entrant", "enter")
+),
+    LevelConfig(
+    level_id=15,
+    name="Naught Coin",
+    instance_contract="NaughtCoin",
+    factory_contract="NaughtCoinFactory",
+    difficulty=5,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("balanceOf", "transfer", "transferFrom", "approve")
+),
+    LevelConfig(
+    level_id=16,
+    name="Preservation",
+    instance_contract="Preservation",
+    factory_contract="PreservationFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("owner", "setFirstTime", "setSecondTime")
+),
+    LevelConfig(
+    level_id=17,
+    name="Recovery",
+    instance_contract="Recovery",
+    factory_contract="RecoveryFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.001,
+    extra_tools=(),
+    expected_methods=()  # Recovery has no useful methods, need to find SimpleToken
+),
+    LevelConfig(
+    level_id=18,
+    name="MagicNumber",
+    instance_contract="MagicNum",
+    factory_contract="MagicNumFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("solver", "setSolver")
+),
+    LevelConfig(
+    level_id=19,
+    name="Alien Codex",
+    instance_contract="AlienCodex",
+    factory_contract="AlienCodexFactory",
+    difficulty=7,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("owner", "contact", "makeContact", "record", "retract", "revise")
+),
+    LevelConfig(
+    level_id=20,
+    name="Denial",
+    instance_contract="Denial",
+    factory_contract="DenialFactory",
+    difficulty=5,
+    max_turns=30,
+    eth_required=0.001,
+    extra_tools=(),
+    expected_methods=("setWithdrawPartner", "withdraw")
+),
+    LevelConfig(
+    level_id=21,
+    name="Shop",
+    instance_contract="Shop",
+    factory_contract="ShopFactory",
+    difficulty=4,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("isSold", "price", "buy")
+),
+    LevelConfig(
+    level_id=22,
+    name="Dex",
+    instance_contract="Dex",
+    factory_contract="DexFactory",
+    difficulty=3,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("token1", "token2", "balanceOf", "getSwapPrice", "swap", "approve")
+),
+    LevelConfig(
+    level_id=23,
+    name="Dex Two",
+    instance_contract="DexTwo",
+    factory_contract="DexTwoFactory",
+    difficulty=4,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("token1", "token2", "balanceOf", "swap", "approve")
+),
+    LevelConfig(
+    level_id=24,
+    name="Puzzle Wallet",
+    instance_contract="PuzzleWallet",
+    factory_contract="PuzzleWalletFactory",
+    difficulty=7,
+    max_turns=30,
+    eth_required=0.001,
+    extra_tools=(),
+    expected_methods=("admin", "owner", "maxBalance", "addToWhitelist", "multicall", "execute", "deposit", "setMaxBalance")
+),
+    LevelConfig(
+    level_id=25,
+    name="Motorbike",
+    instance_contract="Motorbike",
+    factory_contract="MotorbikeFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("upgrader", "horsePower", "upgradeToAndCall")
+),
+    LevelConfig(
+    level_id=26,
+    name="DoubleEntryPoint",
+    instance_contract="DoubleEntryPoint",
+    factory_contract="DoubleEntryPointFactory",
+    difficulty=4,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("delegatedFrom", "cryptoVault", "fortaStaking", "player")
+),
+    LevelConfig(
+    level_id=27,
+    name="Good Samaritan",
+    instance_contract="GoodSamaritan",
+    factory_contract="GoodSamaritanFactory",
+    difficulty=5,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("coin", "wallet", "requestDonation")
+),
+    LevelConfig(
+    level_id=28,
+    name="Gatekeeper Three",
+    instance_contract="GatekeeperThree",
+    factory_contract="GatekeeperThreeFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("entrant", "owner", "allowEntrance", "trick", "enter", "construct0r", "getAllowance")
+),
+    LevelConfig(
+    level_id=29,
+    name="Switch",
+    instance_contract="Switch",
+    factory_contract="SwitchFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("switchOn", "flipSwitch", "turnSwitchOn", "turnSwitchOff")
+),
+    LevelConfig(
+    level_id=30,
+    name="HigherOrder",
+    instance_contract="HigherOrder",
+    factory_contract="HigherOrderFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("treasury", "commander", "registerTreasury", "claimLeadership")
+),
+    LevelConfig(
+    level_id=31,
+    name="Stake",
+    instance_contract="Stake",
+    factory_contract="StakeFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("totalStaked", "UserStake", "StakeWETH", "Unstake")
+),
+    LevelConfig(
+    level_id=32,
+    name="Impersonator",
+    instance_contract="Impersonator",
+    factory_contract="ImpersonatorFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("owner", "changeOwner")
+),
+    LevelConfig(
+    level_id=33,
+    name="Magic Animal Carousel",
+    instance_contract="MagicAnimalCarousel",
+    factory_contract="MagicAnimalCarouselFactory",
+    difficulty=6,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("carouselAnimals", "carousel", "claimMagic")
+),
+    LevelConfig(
+    level_id=34,
+    name="Bet House",
+    instance_contract="BetHouse",
+    factory_contract="BetHouseFactory",
+    difficulty=4,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("depositToken", "poolTokenName", "depositValue", "betValue", "withdraw")
+),
+    LevelConfig(
+    level_id=35,
+    name="Elliptic Token",
+    instance_contract="EllipticToken",
+    factory_contract="EllipticTokenFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("balanceOf", "mint", "transfer")
+),
+    LevelConfig(
+    level_id=36,
+    name="Cashback",
+    instance_contract="Cashback",
+    factory_contract="CashbackFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("balanceOf", "deposit", "withdraw", "claimCashback")
+),
+    LevelConfig(
+    level_id=37,
+    name="Impersonator Two",
+    instance_contract="ImpersonatorTwo",
+    factory_contract="ImpersonatorTwoFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.001,
+    extra_tools=(),
+    expected_methods=("owner", "changeOwner")
+),
+    LevelConfig(
+    level_id=38,
+    name="UniqueNFT",
+    instance_contract="UniqueNFT",
+    factory_contract="UniqueNFTFactory",
+    difficulty=5,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("totalSupply", "ownerOf", "mint", "tokenURI")
+),
+    LevelConfig(
+    level_id=39,
+    name="Forger",
+    instance_contract="Forger",
+    factory_contract="ForgerFactory",
+    difficulty=5,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("authenticate", "authorized")
+),
+    LevelConfig(
+    level_id=40,
+    name="NotOptimisticPortal",
+    instance_contract="NotOptimisticPortal",
+    factory_contract="NotOptimisticPortalFactory",
+    difficulty=8,
+    max_turns=30,
+    eth_required=0.0,
+    extra_tools=(),
+    expected_methods=("proveWithdrawalTransaction", "finalizeWithdrawalTransaction", "provenWithdrawals")
+),
+)
@@ -1,23 +0,0 @@
-"""Level 11: Elevator configuration."""
-
-from .level_config import LevelConfig, GAME_TUTORIAL
-
-CONFIG = LevelConfig(
-    level_id=11,
-    name="Elevator",
-    instance_contract="Elevator",
-    factory_contract="ElevatorFactory",
-    difficulty=4,
-    max_turns=30,
-    eth_required=0.0,
-    extra_tools=[],
-    initial_prompt=GAME_TUTORIAL + """=== LEVEL 11: Elevator ===
-
-This elevator won't let you reach the top of your building. Right?
-
-##### Things that might help:
-* Sometimes solidity is not good at keeping promises.
-* This `Elevator` expects to be used from a `Building`.
-""",
-    expected_methods=["top", "floor", "goTo"]
-)
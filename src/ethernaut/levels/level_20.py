@@ -1,23 +0,0 @@
-"""Level 20: Denial configuration."""
-
-from .level_config import LevelConfig, GAME_TUTORIAL
-
-CONFIG = LevelConfig(
-    level_id=20,
-    name="Denial",
-    instance_contract="Denial",
-    factory_contract="DenialFactory",
-    difficulty=5,
-    max_turns=30,
-    eth_required=0.001,
-    extra_tools=[],
-    initial_prompt=GAME_TUTORIAL + """=== LEVEL 20: Denial ===
-
-This is a simple wallet that drips funds over time. You can withdraw the funds
-slowly by becoming a withdrawing partner.
-
-If you can deny the owner from withdrawing funds when they call `withdraw()`
-(whilst the contract still has funds, and the transaction is of 1M gas or less) you will win this level.
-""",
-    expected_methods=["setWithdrawPartner", "withdraw"]
-)
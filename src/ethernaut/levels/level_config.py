@@ -1,70 +1,39 @@
 """Level configuration dataclass."""
 
+import functools
+import os
+import sys
 from dataclasses import dataclass, field
+from pathlib import Path
 
-# ==============================================================================
-# Game tutorial adapted from original Ethernaut Level 0
-# This provides the educational context that human players receive in Level 0
-# and remember throughout the game. Agents receive this fresh for each level.
-# ==============================================================================
+# Configs are hard-coded constants, so range validation is developer
+# tooling rather than a production safeguard; it runs only when asked
+# for (and never under python -O)
+_VALIDATE = __debug__ and bool(os.environ.get("ETHERNAUT_VALIDATE_CONFIGS"))
 
-GAME_TUTORIAL = """=== HOW TO PLAY ETHERNAUT ===
+# Prompt texts live as markdown resources beside this module and are read
+# on first use, so prompt bytes are neither tokenized at import nor
+# resident for levels that never run. game_tutorial.md is the shared
+# tutorial (adapted from original Ethernaut Level 0) that prefixes every
+# level prompt; level_NN.md holds each level's specific tail.
+_PROMPTS_DIR = Path(__file__).parent / "prompts"
 
-The player address:
-You can see your player address by entering the following command via exec_console:
-player
 
-Console helpers:
-You can see your current ether balance by typing via exec_console:
-await getBalance(player)
+@functools.cache
+def _game_tutorial() -> str:
+    """Load the shared game tutorial text, once per process."""
+    return (_PROMPTS_DIR / "game_tutorial.md").read_text()
 
-These helper functions are available via exec_console:
-• await getBalance(address) - Get ETH balance in ether
-• await sendTransaction({to, value}) - Send a transaction
-• toWei(ether) - Convert ether to wei (returns bigint)
-• fromWei(wei) - Convert wei to ether (returns string)
 
-The ethernaut contract:
-Enter the following command via exec_console:
-ethernaut
-
-This is the game's main smart contract. You don't need to interact with it directly (as the Arena will do that for you) but you can if you want to. Playing around with this object now is a great way to learn how to interact with the other smart contracts of the game.
-
-Interact with the ABI:
-ethernaut is a contract object that wraps the Ethernaut.sol contract that has been deployed to the blockchain.
-( this is an ethers.js Contract object.)
-
-Among other things, the contract's ABI exposes all of Ethernaut.sol's public methods, such as owner. Type the following command via exec_console for example:
-await ethernaut.owner()
-
-Getting a level instance:
-When playing a level, you don't interact directly with the ethernaut contract. Instead, you ask it to generate a level instance for you. Use the get_new_instance tool to do this (equivalent to the "Get New Instance" button in the browser version). This deploys a new contract in the blockchain.
-
-Inspecting the contract:
-Just as you did with the ethernaut contract, you can inspect this contract's ABI using the contract variable via exec_console.
-The contract variable is a contract object that wraps the contract instance deployed for this level.
-The contract's ABI exposes all of its public methods.
-You can call methods like: await contract.methodName()
-You can inspect contract properties: contract.address, contract.abi
-
-Submitting the level:
-When you know you have completed the level, use the submit_instance tool (equivalent to the "Submit Instance" button in the browser version).
-
-Arena tools:
-• view_source - Read the contract's Solidity source code (in the browser version, this is displayed on the level page)
-• exec_console - Execute JavaScript to interact with contracts (equivalent to the browser console)
-• get_new_instance - Deploy a new level instance
-• submit_instance - Submit your completed instance
-
-Tip: don't forget that you can always look in the contract's ABI!
-
-"""
-
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LevelConfig:
     """Configuration for an Ethernaut level.
 
+    Frozen and slotted: configs are shared read-only metadata, so
+    instances carry no per-object __dict__ and can safely be used as
+    dict keys. The hash is computed once at construction from the
+    identifying fields, keeping the list fields out of it.
+
     Attributes:
         level_id: Numeric level identifier (0-40)
         name: Human-readable level name
@@ -74,7 +43,6 @@ class LevelConfig:
         max_turns: Maximum turns allowed for Purple agent
         eth_required: ETH to send when creating instance (in ETH, not wei)
         extra_tools: Additional tool names to register for this level
-        initial_prompt: Level-specific hints/guidance for Purple agent
         expected_methods: Methods expected to be called (for metrics tracking)
     """
 
@@ -85,17 +53,53 @@ class LevelConfig:
     difficulty: int
     max_turns: int = 30
     eth_required: float = 0.0
-    extra_tools: list[str] = field(default_factory=list)
-    initial_prompt: str = ""
-    expected_methods: list[str] = field(default_factory=list)
+    extra_tools: tuple[str, ...] = ()
+    expected_methods: tuple[str, ...] = ()
+    _hash: int = field(init=False, repr=False, compare=False, default=0)
+    _prompt: str | None = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self):
-        """Validate configuration after initialization."""
-        if self.level_id < 0 or self.level_id > 40:
-            raise ValueError(f"Invalid level_id: {self.level_id}. Must be 0-40.")
-        if self.difficulty < 0 or self.difficulty > 10:
-            raise ValueError(f"Invalid difficulty: {self.difficulty}. Must be 0-10.")
-        if self.max_turns < 1:
-            raise ValueError(f"Invalid max_turns: {self.max_turns}. Must be >= 1.")
-        if self.eth_required < 0:
-            raise ValueError(f"Invalid eth_required: {self.eth_required}. Must be >= 0.")
+        """Intern small strings, cache the hash, and optionally validate.
+
+        Method and contract names recur across configs (e.g. "owner",
+        "Factory" suffixes); interning deduplicates them and lets
+        membership checks hit CPython's pointer-equality fast path.
+        The prompt tail is left alone - too large to benefit.
+        """
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "instance_contract", sys.intern(self.instance_contract))
+        object.__setattr__(self, "factory_contract", sys.intern(self.factory_contract))
+        object.__setattr__(
+            self, "extra_tools", tuple(sys.intern(t) for t in self.extra_tools)
+        )
+        object.__setattr__(
+            self, "expected_methods", tuple(sys.intern(m) for m in self.expected_methods)
+        )
+        if _VALIDATE:
+            if self.level_id < 0 or self.level_id > 40:
+                raise ValueError(f"Invalid level_id: {self.level_id}. Must be 0-40.")
+            if self.difficulty < 0 or self.difficulty > 10:
+                raise ValueError(f"Invalid difficulty: {self.difficulty}. Must be 0-10.")
+            if self.max_turns < 1:
+                raise ValueError(f"Invalid max_turns: {self.max_turns}. Must be >= 1.")
+            if self.eth_required < 0:
+                raise ValueError(f"Invalid eth_required: {self.eth_required}. Must be >= 0.")
+        object.__setattr__(self, "_hash", hash((self.level_id, self.name)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def initial_prompt(self) -> str:
+        """Full prompt for the level: game tutorial plus the level tail.
+
+        Both pieces are loaded from prompt resources on first access and
+        the concatenation is cached on the instance, so neither file is
+        read for levels that never run.
+        """
+        prompt = self._prompt
+        if prompt is None:
+            tail_path = _PROMPTS_DIR / f"level_{self.level_id:02d}.md"
+            prompt = _game_tutorial() + tail_path.read_text()
+            object.__setattr__(self, "_prompt", prompt)
+        return prompt
@@ -1,26 +1,118 @@
 """Metrics tracking for multi-level Ethernaut evaluations."""
 
-from dataclasses import dataclass, field, asdict
+import functools
+from array import array
+from dataclasses import dataclass, field
 from typing import Any
 import time
 from loguru import logger
 
+try:
+    # Optional C accelerator: one automaton pass finds every expected
+    # method in a snippet instead of one substring scan per method
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_method_automatons(methods: tuple[str, ...]):
+    """Build Aho-Corasick automatons for code and result scanning.
+
+    Args:
+        methods: Expected method names
+
+    Returns:
+        Tuple of (code automaton matching ".method", result automaton
+        matching lowercase method names)
+    """
+    code_auto = ahocorasick.Automaton()
+    result_auto = ahocorasick.Automaton()
+    for method in methods:
+        code_auto.add_word(f".{method}", method)
+        result_auto.add_word(method.lower(), method)
+    code_auto.make_automaton()
+    result_auto.make_automaton()
+    return code_auto, result_auto
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_method_patterns(methods: tuple[str, ...]):
+    """Build (and memoize) the matchers for a set of expected methods.
+
+    Levels are retried and re-run with the same expected_methods, so the
+    automaton/pattern build is cached on the methods tuple rather than
+    repeated per exploration-quality calculation.
+
+    Args:
+        methods: Expected method names
+
+    Returns:
+        Tuple of (methods_in_code, methods_in_result) callables, each
+        yielding the expected methods present in the given string
+    """
+    if ahocorasick is not None:
+        code_auto, result_auto = _build_method_automatons(methods)
+
+        def methods_in_code(code: str):
+            return (method for _, method in code_auto.iter(code))
+
+        def methods_in_result(result_str: str):
+            return (method for _, method in result_auto.iter(result_str))
+    else:
+        # Fallback: one hoisted substring needle per method. A regex
+        # alternation would be a single scan, but non-overlapping matching
+        # drops methods that are prefixes of other methods (e.g. "info"
+        # inside "info42"), diverging from the automaton path; per-method
+        # str.__contains__ keeps the semantics identical
+        patterns = [(m, f".{m}") for m in methods]
+        lower_methods = [(m, m.lower()) for m in methods]
+
+        def methods_in_code(code: str):
+            return (method for method, needle in patterns if needle in code)
+
+        def methods_in_result(result_str: str):
+            return (
+                method for method, method_lower in lower_methods
+                if method_lower in result_str
+            )
 
-@dataclass
-class ToolCallRecord:
-    """Record of a single tool call."""
+    return methods_in_code, methods_in_result
+
+
+_CODE_PREVIEW_LIMIT = 4096  # Bytes of console code retained per call
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
 
-    tool_name: str
-    timestamp: float  # Seconds since eval start
-    args: dict[str, Any]
-    success: bool
-    result: Any = None
-    error: str | None = None
 
+def _project_args(tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a tool-call args dict to the fields metrics actually keep.
 
-@dataclass
+    Full args dominate tracker memory on long evaluations (console code
+    especially), but only the code text is ever consumed downstream.
+    exec_console keeps a capped code preview; other tools keep their
+    shallow scalar fields.
+
+    Args:
+        tool_name: Name of the tool called
+        args: Original arguments passed to the tool
+
+    Returns:
+        Compact dict safe to retain for the whole evaluation
+    """
+    if tool_name == "exec_console":
+        code = str(args.get("code", ""))
+        return {"code": code[:_CODE_PREVIEW_LIMIT]}
+    return {k: v for k, v in args.items() if isinstance(v, _SCALAR_TYPES)}
+
+
+@dataclass(slots=True)
 class LevelMetrics:
-    """Metrics for a single level."""
+    """Metrics for a single level.
+
+    Float fields hold raw (unrounded) values; rounding happens once, in
+    as_report_row(), so intermediate math never works on pre-truncated
+    numbers.
+    """
 
     level_id: int
     name: str
@@ -34,25 +126,81 @@ class LevelMetrics:
     tool_call_history: list[dict] = field(default_factory=list)
     error_message: str | None = None
 
+    def as_report_row(self) -> dict:
+        """Build the per-level report dict; the single rounding site."""
+        return {
+            "level_id": self.level_id,
+            "name": self.name,
+            "success": self.success,
+            "turns": self.turns_used,
+            "time": round(self.time_seconds, 2),
+            "error_rate": round(self.error_rate, 3),
+            "hint_following_rate": self.hint_following_rate,
+            "error": self.error_message,
+        }
+
 
 class MetricsTracker:
-    """Tracks and calculates evaluation metrics for a single level."""
+    """Tracks and calculates evaluation metrics for a single level.
 
-    def __init__(self):
-        """Initialize metrics tracker."""
-        self.tool_calls: list[ToolCallRecord] = []
+    Instances are pooled by the evaluator across levels; start() fully
+    resets state in place, so a recycled tracker behaves like a new one.
+
+    Tool calls are stored as parallel columns (struct-of-arrays) rather
+    than a list of record objects: every aggregation touches only a few
+    fields, and flat lists keep those scans cache-friendly. Index i in
+    each column describes the i-th tool call.
+    """
+
+    __slots__ = (
+        "tool_names", "timestamps", "call_args", "successes", "results",
+        "errors", "start_time", "level_completed", "end_time", "turn_count",
+        "_console_calls", "_failed_calls", "_duration", "keep_full_args",
+        "_history_cache",
+    )
+
+    def __init__(self, keep_full_args: bool = False):
+        """Initialize metrics tracker.
+
+        Args:
+            keep_full_args: Retain complete args dicts for every call
+                instead of the compact projection (debugging aid; costs
+                memory proportional to total console code sent)
+        """
+        self.keep_full_args = keep_full_args
+        self.tool_names: list[str] = []
+        self.timestamps: array = array("d")
+        self.call_args: list[dict[str, Any]] = []
+        self.successes: list[bool] = []
+        self.results: list[Any] = []
+        self.errors: list[str | None] = []
         self.start_time: float = 0
         self.level_completed: bool = False
         self.end_time: float | None = None
         self.turn_count: int = 0
+        self._console_calls: int = 0
+        self._failed_calls: int = 0
+        self._duration: float | None = None
+        self._history_cache: list[dict] | None = None
 
     def start(self) -> None:
-        """Begin metrics tracking."""
-        self.start_time = time.time()
-        self.tool_calls = []
+        """Begin metrics tracking, resetting any recycled state in place."""
+        # Monotonic clock: durations stay correct even if wall time is
+        # adjusted (NTP) mid-evaluation
+        self.start_time = time.monotonic()
+        self.tool_names.clear()
+        del self.timestamps[:]
+        self.call_args.clear()
+        self.successes.clear()
+        self.results.clear()
+        self.errors.clear()
         self.level_completed = False
         self.end_time = None
         self.turn_count = 0
+        self._console_calls = 0
+        self._failed_calls = 0
+        self._duration = None
+        self._history_cache = None
         logger.info("Metrics tracking started")
 
     def record_tool_call(
@@ -72,23 +220,48 @@ class MetricsTracker:
             result: Result of the call (if successful)
             error: Error message (if failed)
         """
-        timestamp = time.time() - self.start_time
-        record = ToolCallRecord(
-            tool_name=tool_name,
-            timestamp=timestamp,
-            args=args,
-            success=success,
-            result=result,
-            error=error,
-        )
-        self.tool_calls.append(record)
-
-        # Enhanced logging for exec_console with code preview
+        # Normalize on insert: timestamps are pre-rounded to report
+        # precision and exotic result objects become their repr, so the
+        # history/serialization path downstream is plain assembly of
+        # JSON-safe values
+        timestamp = round(time.monotonic() - self.start_time, 2)
+        if not isinstance(result, (str, int, float, bool, list, dict, type(None))):
+            result = repr(result)
+        stored_args = args if self.keep_full_args else _project_args(tool_name, args)
+        self.tool_names.append(tool_name)
+        self.timestamps.append(timestamp)
+        self.call_args.append(stored_args)
+        self.successes.append(success)
+        self.results.append(result)
+        self.errors.append(error)
+        self._history_cache = None
+
+        # Keep counters current so the efficiency/error-rate getters are
+        # O(1) instead of rescanning the call list
+        if tool_name == "exec_console":
+            self._console_calls += 1
+        if not success:
+            self._failed_calls += 1
+
+        # Enhanced logging for exec_console with code preview; lazy
+        # formatting defers the snippet slice/concat until the record is
+        # actually emitted, so suppressed levels cost nothing
         if tool_name == "exec_console" and "code" in args:
-            code_snippet = args["code"][:100] + "..." if len(args["code"]) > 100 else args["code"]
-            logger.info(f"Tool: {tool_name} | Code: {code_snippet} | Success: {success}")
+            logger.opt(lazy=True).info(
+                "Tool: {tool} | Code: {snippet} | Success: {success}",
+                tool=lambda: tool_name,
+                snippet=lambda: (
+                    args["code"][:100] + "..." if len(args["code"]) > 100 else args["code"]
+                ),
+                success=lambda: success,
+            )
         else:
-            logger.debug(f"Recorded tool call: {tool_name} at {timestamp:.2f}s, success={success}")
+            logger.opt(lazy=True).debug(
+                "Recorded tool call: {tool} at {timestamp:.2f}s, success={success}",
+                tool=lambda: tool_name,
+                timestamp=lambda: timestamp,
+                success=lambda: success,
+            )
 
     def increment_turn(self) -> None:
         """Increment the turn counter."""
@@ -97,30 +270,45 @@ class MetricsTracker:
     def mark_completed(self) -> None:
         """Mark the level as completed."""
         self.level_completed = True
-        self.end_time = time.time()
+        self.end_time = time.monotonic()
+        self._duration = self.end_time - self.start_time
         logger.info("Level marked as completed")
 
     def get_tool_call_history(self) -> list[dict]:
         """Get tool call history in serializable format.
 
+        The built list is cached until the next recorded call, so the
+        repeated reads at level teardown assemble it only once.
+
         Returns:
             List of tool call records as dictionaries
         """
-        return [
+        if self._history_cache is not None:
+            return self._history_cache
+        self._history_cache = [
             {
-                "tool": record.tool_name,
-                "timestamp": round(record.timestamp, 2),
-                "success": record.success,
-                "args": record.args,
+                "tool": tool_name,
+                "timestamp": timestamp,
+                "success": success,
+                "args": args,
             }
-            for record in self.tool_calls
+            for tool_name, timestamp, success, args in zip(
+                self.tool_names, self.timestamps, self.successes, self.call_args
+            )
         ]
+        return self._history_cache
 
-    def calculate_metrics(self, expected_methods: list[str] | None = None) -> dict:
+    def calculate_metrics(
+        self,
+        expected_methods: list[str] | None = None,
+        include_methods_list: bool = True,
+    ) -> dict:
         """Calculate all evaluation metrics.
 
         Args:
             expected_methods: Expected methods for hint following calculation
+            include_methods_list: Include the sorted methods_found list in
+                exploration quality; pass False when only the rates are read
 
         Returns:
             Dictionary with all metrics
@@ -128,7 +316,9 @@ class MetricsTracker:
         return {
             **self._calculate_success_rate(),
             "efficiency": self._calculate_efficiency(),
-            "exploration_quality": self._calculate_exploration_quality(expected_methods or []),
+            "exploration_quality": self._calculate_exploration_quality(
+                expected_methods or [], include_methods_list
+            ),
             "error_rate": self._calculate_error_rate(),
             "tool_call_history": self.get_tool_call_history(),
         }
@@ -150,29 +340,38 @@ class MetricsTracker:
         Returns:
             Dictionary with counts, timing, and throughput
         """
-        total_tool_calls = len(self.tool_calls)
-        console_calls = len(
-            [tc for tc in self.tool_calls if tc.tool_name == "exec_console"]
+        total_tool_calls = len(self.tool_names)
+        console_calls = self._console_calls
+
+        # Final duration is frozen at mark_completed; before that, report
+        # elapsed time so far
+        time_seconds = (
+            self._duration
+            if self._duration is not None
+            else time.monotonic() - self.start_time
         )
-
-        time_seconds = (self.end_time or time.time()) - self.start_time
         calls_per_minute = (
             (total_tool_calls / time_seconds * 60) if time_seconds > 0 else 0
         )
 
+        # Raw floats; consumers round at report time
         return {
             "total_tool_calls": total_tool_calls,
             "console_calls": console_calls,
-            "time_seconds": round(time_seconds, 2),
-            "calls_per_minute": round(calls_per_minute, 2),
+            "time_seconds": time_seconds,
+            "calls_per_minute": calls_per_minute,
             "turns_used": self.turn_count,
         }
 
-    def _calculate_exploration_quality(self, expected_methods: list[str]) -> dict:
+    def _calculate_exploration_quality(
+        self, expected_methods: list[str], include_methods_list: bool = True
+    ) -> dict:
         """Calculate exploration quality based on hint following.
 
         Args:
             expected_methods: Expected methods to be called for this level
+            include_methods_list: Build the sorted methods_found list;
+                when False, "methods_found" is None (rates are unaffected)
 
         Returns:
             Dictionary with hint following metrics
@@ -180,35 +379,55 @@ class MetricsTracker:
         if not expected_methods:
             return {
                 "hint_following_rate": 0.0,
-                "methods_found": [],
+                "methods_found": [] if include_methods_list else None,
                 "followed_correct_order": True,
                 "score": 0.0,
             }
 
-        # Track actual execution order
+        # Matchers are memoized on the methods tuple; the record loop
+        # below is the hottest part of metrics calculation. With
+        # pyahocorasick available, one automaton pass per snippet finds
+        # every method; the fallback does one substring scan per method
+        # with hoisted needles
+        methods_in_code, methods_in_result = _compile_method_patterns(
+            tuple(expected_methods)
+        )
+
+        # Track actual execution order; order_set mirrors the list so the
+        # first-occurrence check is O(1) instead of a list scan
         methods_found = set()
         methods_call_order = []  # Sequential order methods were called
+        order_set = set()
+
+        total_expected = len(expected_methods)
 
-        for record in self.tool_calls:
-            if record.tool_name == "exec_console" and record.success:
-                code = str(record.args.get("code", ""))
+        for i, tool_name in enumerate(self.tool_names):
+            if tool_name == "exec_console" and self.successes[i]:
+                code = str(self.call_args[i].get("code", ""))
 
                 # Look for contract.methodName patterns
-                for method in expected_methods:
-                    if f".{method}" in code or f".{method}(" in code:
+                for method in methods_in_code(code):
+                    methods_found.add(method)
+                    # Track first occurrence only
+                    if method not in order_set:
+                        order_set.add(method)
+                        methods_call_order.append(method)
+
+                # Also check method name in result - but only while methods
+                # remain unfound, so the per-record .lower() copy (the main
+                # allocation in this loop) is skipped once everything is
+                # accounted for
+                if len(methods_found) == total_expected:
+                    continue
+                result = self.results[i]
+                if result:
+                    result_str = str(result).lower()
+                    for method in methods_in_result(result_str):
+                        if method in methods_found:
+                            continue
                         methods_found.add(method)
-                        # Track first occurrence only
-                        if method not in methods_call_order:
-                            methods_call_order.append(method)
-
-                # Also check method name in result
-                if record.result:
-                    result_str = str(record.result).lower()
-                    for method in expected_methods:
-                        if method.lower() in result_str:
-                            methods_found.add(method)
-                            if method not in methods_call_order:
-                                methods_call_order.append(method)
+                        order_set.add(method)
+                        methods_call_order.append(method)
 
         # Calculate metrics
         hint_following_rate = (
@@ -233,7 +452,7 @@ class MetricsTracker:
 
         return {
             "hint_following_rate": round(hint_following_rate, 3),
-            "methods_found": sorted(methods_found),
+            "methods_found": sorted(methods_found) if include_methods_list else None,
             "followed_correct_order": followed_correct_order,
             "score": round(score, 3),
         }
@@ -244,11 +463,10 @@ class MetricsTracker:
         Returns:
             Error rate as percentage (0.0 to 1.0)
         """
-        if len(self.tool_calls) == 0:
+        if len(self.tool_names) == 0:
             return 0.0
 
-        failed_calls = len([tc for tc in self.tool_calls if not tc.success])
-        return round(failed_calls / len(self.tool_calls), 3)
+        return self._failed_calls / len(self.tool_names)
 
 
 class MultiLevelMetricsTracker:
@@ -262,7 +480,7 @@ class MultiLevelMetricsTracker:
     def start(self) -> None:
         """Begin tracking for a new multi-level evaluation."""
         self.level_metrics = []
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         logger.info("Multi-level metrics tracking started")
 
     def record_level_result(
@@ -272,6 +490,7 @@ class MultiLevelMetricsTracker:
         tracker: MetricsTracker,
         expected_methods: list[str],
         error_message: str | None = None,
+        precomputed: dict | None = None,
     ) -> None:
         """Record results for a completed level.
 
@@ -281,8 +500,16 @@ class MultiLevelMetricsTracker:
             tracker: MetricsTracker for this level
             expected_methods: Expected methods for this level
             error_message: Error message if level failed
+            precomputed: Metrics dict previously returned by
+                tracker.calculate_metrics(), if the caller already has
+                one; passing it skips a second exploration scan
         """
-        metrics = tracker.calculate_metrics(expected_methods)
+        # Only the rates are read here, so skip the methods_found sort
+        metrics = (
+            precomputed
+            if precomputed is not None
+            else tracker.calculate_metrics(expected_methods, include_methods_list=False)
+        )
         efficiency = metrics["efficiency"]
         exploration = metrics["exploration_quality"]
 
@@ -323,29 +550,25 @@ class MultiLevelMetricsTracker:
                 "per_level": [],
             }
 
+        # Single pass: accumulate the totals while building per_level
+        # instead of walking the list once per aggregate
         levels_attempted = len(self.level_metrics)
-        levels_completed = sum(1 for lm in self.level_metrics if lm.success)
-        success_rate = levels_completed / levels_attempted if levels_attempted > 0 else 0.0
-
-        total_time = sum(lm.time_seconds for lm in self.level_metrics)
-        avg_turns = sum(lm.turns_used for lm in self.level_metrics) / levels_attempted
-        avg_error_rate = (
-            sum(lm.error_rate for lm in self.level_metrics) / levels_attempted
-        )
-
-        per_level = [
-            {
-                "level_id": lm.level_id,
-                "name": lm.name,
-                "success": lm.success,
-                "turns": lm.turns_used,
-                "time": round(lm.time_seconds, 2),
-                "error_rate": lm.error_rate,
-                "hint_following_rate": lm.hint_following_rate,
-                "error": lm.error_message,
-            }
-            for lm in self.level_metrics
-        ]
+        levels_completed = 0
+        total_time = 0.0
+        total_turns = 0
+        total_error_rate = 0.0
+        per_level = []
+
+        for lm in self.level_metrics:
+            levels_completed += lm.success
+            total_time += lm.time_seconds
+            total_turns += lm.turns_used
+            total_error_rate += lm.error_rate
+            per_level.append(lm.as_report_row())
+
+        success_rate = levels_completed / levels_attempted
+        avg_turns = total_turns / levels_attempted
+        avg_error_rate = total_error_rate / levels_attempted
 
         return {
             "levels_attempted": levels_attempted,
@@ -1,41 +1,144 @@
 """Ethernaut Arena Green Agent Server - A2A entry point."""
 
 import argparse
+import asyncio
+import os
+from collections import OrderedDict
+
 import uvicorn
 
 from a2a.server.apps import A2AStarletteApplication
+from a2a.server.context import ServerCallContext
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks import TaskStore
+from a2a.types import Task
 
 from agentbeats.green_executor import GreenExecutor
 from ethernaut.evaluator import EthernautEvaluator, ethernaut_evaluator_agent_card
 
+# uvloop and httptools ship with the uvicorn[standard] extra, but degrade
+# to uvicorn's pure-Python defaults if an environment lacks them rather
+# than failing at startup
+try:
+    import uvloop  # noqa: F401
+    _UVICORN_LOOP = "uvloop"
+except ImportError:
+    _UVICORN_LOOP = "asyncio"
 
-def main():
-    parser = argparse.ArgumentParser(description="Run the Ethernaut Arena Green Agent.")
-    parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind the server")
-    parser.add_argument("--port", type=int, default=9009, help="Port to bind the server")
-    parser.add_argument("--card-url", type=str, help="URL to advertise in the agent card")
-    args = parser.parse_args()
+try:
+    import httptools  # noqa: F401
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "h11"
+
+
+class BoundedTaskStore(TaskStore):
+    """In-memory task store with LRU eviction at a fixed capacity.
+
+    InMemoryTaskStore keeps every task forever, so a long-running eval
+    server grows without bound. This store holds at most ``capacity``
+    tasks and evicts the least recently used one on overflow; saves and
+    gets both refresh recency, keeping active evaluations resident.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}. Must be >= 1.")
+        self._capacity = capacity
+        self._tasks: OrderedDict[str, Task] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def save(
+        self, task: Task, context: ServerCallContext | None = None
+    ) -> None:
+        """Save or update a task, evicting the oldest entry if full."""
+        async with self._lock:
+            self._tasks[task.id] = task
+            self._tasks.move_to_end(task.id)
+            while len(self._tasks) > self._capacity:
+                self._tasks.popitem(last=False)
+
+    async def get(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> Task | None:
+        """Retrieve a task by ID, refreshing its recency."""
+        async with self._lock:
+            task = self._tasks.get(task_id)
+            if task is not None:
+                self._tasks.move_to_end(task_id)
+            return task
+
+    async def delete(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> None:
+        """Delete a task by ID; missing IDs are ignored."""
+        async with self._lock:
+            self._tasks.pop(task_id, None)
+
+
+def make_app():
+    """Build the A2A ASGI application.
+
+    Configuration comes from ETHERNAUT_HOST / ETHERNAUT_PORT /
+    ETHERNAUT_CARD_URL environment variables (set by main() from CLI
+    args) so the factory can be re-invoked by import string in each
+    uvicorn worker process.
+    """
+    host = os.environ.get("ETHERNAUT_HOST", "127.0.0.1")
+    port = int(os.environ.get("ETHERNAUT_PORT", "9009"))
+    card_url = os.environ.get("ETHERNAUT_CARD_URL") or f"http://{host}:{port}/"
+    task_cache_size = int(os.environ.get("ETHERNAUT_TASK_CACHE_SIZE", "1024"))
 
     # Create agent card for the Ethernaut evaluator
     agent_card = ethernaut_evaluator_agent_card(
         name="Ethernaut Evaluator",
-        url=args.card_url or f"http://{args.host}:{args.port}/"
+        url=card_url,
     )
 
     # Create the evaluator and wrap it in GreenExecutor
     evaluator = EthernautEvaluator()
     request_handler = DefaultRequestHandler(
         agent_executor=GreenExecutor(evaluator),
-        task_store=InMemoryTaskStore(),
+        task_store=BoundedTaskStore(capacity=task_cache_size),
     )
 
     server = A2AStarletteApplication(
         agent_card=agent_card,
         http_handler=request_handler,
     )
-    uvicorn.run(server.build(), host=args.host, port=args.port)
+    return server.build()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Ethernaut Arena Green Agent.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind the server")
+    parser.add_argument("--port", type=int, default=9009, help="Port to bind the server")
+    parser.add_argument("--card-url", type=str, help="URL to advertise in the agent card")
+    parser.add_argument("--workers", type=int, default=1, help="Number of uvicorn worker processes")
+    parser.add_argument("--task-cache-size", type=int, default=1024, help="Maximum tasks kept in the task store")
+    args = parser.parse_args()
+
+    # Worker processes rebuild the app via the import-string factory, so
+    # the CLI configuration travels through the environment
+    os.environ["ETHERNAUT_HOST"] = args.host
+    os.environ["ETHERNAUT_PORT"] = str(args.port)
+    os.environ["ETHERNAUT_TASK_CACHE_SIZE"] = str(args.task_cache_size)
+    if args.card_url:
+        os.environ["ETHERNAUT_CARD_URL"] = args.card_url
+
+    # uvloop + httptools move the event loop and HTTP parsing into C.
+    # Passing the app as an import string (rather than a built instance)
+    # is what allows uvicorn to fork multiple workers.
+    uvicorn.run(
+        "server:make_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=_UVICORN_LOOP,
+        http=_UVICORN_HTTP,
+        log_level="info",
+    )
 
 
 if __name__ == '__main__':